@@ -0,0 +1,416 @@
+"""Provide asynchronous API client for TVDB API v2.0 services.
+
+This module requires ``aiohttp`` and is therefore python 3 only; it is
+an optional companion to :py:mod:`tvdbapi_client.api` for callers that
+want to overlap many requests (e.g. paginating episodes across several
+series) with :py:func:`asyncio.gather`.
+"""
+import asyncio
+import functools
+import logging
+import time
+
+import aiohttp
+from oslo_config import cfg
+
+from tvdbapi_client import api
+from tvdbapi_client import exceptions
+from tvdbapi_client import timeutil
+
+LOG = logging.getLogger(__name__)
+
+cfg.CONF.import_group('tvdb', 'tvdbapi_client.options')
+
+# sizing for the shared keep-alive connector
+CONNECTOR_LIMIT = 20
+KEEPALIVE_TIMEOUT = 60
+
+
+def error_map(func):
+    """Wrap exceptions raised by aiohttp.
+
+    .. py:decorator:: error_map
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except aiohttp.ClientResponseError as err:
+            exc = exceptions.TVDBRequestException(
+                (err.status, err.message))
+            exc.status = err.status
+            raise exc
+        except aiohttp.ClientError as err:
+            raise exceptions.TVDBRequestException((None, str(err)))
+    return wrapper
+
+
+def requires_auth(func):
+    """Handle authentication checks.
+
+    .. py:decorator:: requires_auth
+
+        Checks if the token has expired and performs authentication if needed.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        if self.token_expired:
+            # double-checked so gathered coroutines refresh the
+            # token once instead of racing authenticate
+            async with self._auth_lock:
+                if self.token_expired:
+                    await self.authenticate()
+        return await func(self, *args, **kwargs)
+    return wrapper
+
+
+class AsyncTVDBClient(object):
+
+    """TVDB Api client (asyncio)."""
+
+    __slots__ = (
+        '_apikey',
+        '_username',
+        '_userpass',
+        '_token',
+        '_login_body',
+        '_token_timer',
+        '_token_deadline',
+        '_session',
+        '_auth_lock',
+        '_auth_header',
+        '_headers_cache',
+        '_language',
+        '_url_cache',
+        '_base_url',
+        '_verify',
+        '_select_first',
+    )
+
+    def __init__(self, apikey=None, username=None, userpass=None):
+        """Create new instance of API client.
+
+        :param str apikey: apikey from thetvdb
+        :param str username: username used on thetvdb
+        :param str userpass: password used on thetvdb
+        """
+        self._apikey = apikey or cfg.CONF.tvdb.apikey
+        self._username = username or cfg.CONF.tvdb.username
+        self._userpass = userpass or cfg.CONF.tvdb.userpass
+        self._token = None
+        # the login body only depends on the credentials, so it is
+        # encoded once here instead of per authentication
+        self._login_body = api._dumps({'apikey': self._apikey,
+                                       'username': self._username,
+                                       'userpass': self._userpass,
+                                       })
+
+        self._token_timer = None
+        self._token_deadline = 0.0
+        self._session = None
+        self._auth_lock = asyncio.Lock()
+        self._auth_header = None
+        self._headers_cache = None
+        self._language = 'en'
+        self._url_cache = {}
+        self.reload_config()
+
+    def reload_config(self):
+        """Re-read service configuration into the client.
+
+        Configuration is snapshotted into plain instance attributes so
+        the request hot path does not pay oslo.config attribute lookups
+        per call; call this after changing any tvdb option at runtime.
+        """
+        self._base_url = cfg.CONF.tvdb.service_url.rstrip('/')
+        self._verify = cfg.CONF.tvdb.verify_ssl_certs
+        self._select_first = cfg.CONF.tvdb.select_first
+        self._url_cache.clear()
+
+    @property
+    def headers(self):
+        """Provide access to updated headers."""
+        if self._headers_cache is None:
+            headers = dict(api.DEFAULT_HEADERS)
+            headers['Accept-Language'] = self._language
+            if self._auth_header:
+                headers['Authorization'] = self._auth_header
+            self._headers_cache = headers
+        return self._headers_cache
+
+    @property
+    def language(self):
+        """Provide access to current language."""
+        return self._language
+
+    @language.setter
+    def language(self, abbr):
+        """Provide access to update language."""
+        self._language = abbr
+        self._headers_cache = None
+
+    @property
+    def token_expired(self):
+        """Provide access to flag indicating if token has expired.
+
+        The deadline is precomputed against the monotonic clock at
+        authentication time, so the per-request check is a single
+        float compare.
+        """
+        return time.monotonic() >= self._token_deadline
+
+    @property
+    def session(self):
+        """Provide access to a shared aiohttp client session.
+
+        A single session with a keep-alive connector is used for the
+        life of the client so concurrent requests share the pooled
+        connections.
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=CONNECTOR_LIMIT,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT,
+                    ssl=api._make_ssl_context() if self._verify else False))
+        return self._session
+
+    async def close(self):
+        """Close the underlying client session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @error_map
+    async def _exec_request(self, service, method=None, path_args=None,
+                            data=None, params=None):
+        """Execute request."""
+        try:
+            url = self._url_cache[service]
+        except KeyError:
+            url = self._url_cache[service] = '%s/%s' % (
+                self._base_url, service.strip('/'))
+        if path_args:
+            url = '%s/%s' % (
+                url, '/'.join(str(a).strip('/') for a in path_args))
+
+        LOG.debug('executing request (%s %s)', method or 'get', url)
+        if data is not None and not isinstance(
+                data, (bytes, bytearray, memoryview, str)):
+            data = api._dumps(data)
+        async with self.session.request(
+                method or 'get', url,
+                data=data,
+                headers=self.headers,
+                params=params,
+                raise_for_status=True) as resp:
+            content = await resp.read()
+            return api._loads(content) if content else ''
+
+    async def _login(self):
+        return await self._exec_request(
+            'login', method='post', data=self._login_body)
+
+    async def _refresh_token(self):
+        return await self._exec_request('refresh_token')
+
+    async def authenticate(self):
+        """Aquire authorization token for using thetvdb apis."""
+        if self._token:
+            try:
+                resp = await self._refresh_token()
+            except exceptions.TVDBRequestException as err:
+                # if a 401 is the cause try to login
+                if getattr(err, 'status', 0) == 401:
+                    resp = await self._login()
+                else:
+                    raise
+        else:
+            resp = await self._login()
+
+        self._token = resp.get('token')
+        self._auth_header = (
+            'Bearer %s' % self._token if self._token else None)
+        self._headers_cache = None
+        self._token_timer = timeutil.utcnow()
+        self._token_deadline = time.monotonic() + api.TOKEN_TTL
+
+    @requires_auth
+    async def search_series(self, **kwargs):
+        """Provide the ability to search for a series.
+
+        .. warning::
+
+            authorization token required
+
+        The following search arguments currently supported:
+
+            * name
+            * imdbId
+            * zap2itId
+
+        :param kwargs: keyword arguments to search for series
+        :returns: series record or series records
+        :rtype: dict
+        """
+        params = {arg: val for arg, val in kwargs.items()
+                  if arg in api.SERIES_BY}
+        resp = await self._exec_request(
+            'search', path_args=['series'], params=params)
+        if self._select_first:
+            return resp['data'][0]
+        return resp['data']
+
+    @requires_auth
+    async def get_series(self, series_id):
+        """Retrieve series record.
+
+        .. warning::
+
+            authorization token required
+
+        :param str series_id: id of series as found on thetvdb
+        :returns: series record
+        :rtype: dict
+        """
+        resp = await self._exec_request('series', path_args=[series_id])
+        return resp['data']
+
+    @requires_auth
+    async def get_episodes(self, series_id, **kwargs):
+        """All episodes for a given series.
+
+        Paginated with 100 results per page.
+
+        .. warning::
+
+            authorization token required
+
+        The following search arguments currently supported:
+
+            * airedSeason
+            * airedEpisode
+            * imdbId
+            * dvdSeason
+            * dvdEpisode
+            * absoluteNumber
+            * page
+
+        :param str series_id: id of series as found on thetvdb
+        :parm kwargs: keyword args to search/filter episodes by (optional)
+        :returns: series episode records
+        :rtype: list
+        """
+        params = {'page': 1}
+        for arg, val in kwargs.items():
+            if arg in api.EPISODES_BY:
+                params[arg] = val
+        resp = await self._exec_request(
+            'series',
+            path_args=[series_id, 'episodes', 'query'], params=params)
+        return resp['data']
+
+    async def iter_episodes(self, series_id, **kwargs):
+        """Iterate over all episodes for a given series.
+
+        Pages are fetched lazily (100 results per page) by following
+        the pagination links, and each page is released before the next
+        one is requested, keeping peak memory flat even for series with
+        thousands of episodes.
+
+        .. warning::
+
+            authorization token required
+
+        The following search arguments currently supported:
+
+            * airedSeason
+            * airedEpisode
+            * imdbId
+            * dvdSeason
+            * dvdEpisode
+            * absoluteNumber
+            * page
+
+        :param str series_id: id of series as found on thetvdb
+        :parm kwargs: keyword args to search/filter episodes by (optional)
+        :returns: asynchronous generator of series episode records
+        :rtype: async generator
+        """
+        # async generators cannot go through the requires_auth
+        # coroutine decorator, so the check is inlined here.
+        if self.token_expired:
+            async with self._auth_lock:
+                if self.token_expired:
+                    await self.authenticate()
+        params = {'page': 1}
+        for arg, val in kwargs.items():
+            if arg in api.EPISODES_BY:
+                params[arg] = val
+        while True:
+            resp = await self._exec_request(
+                'series',
+                path_args=[series_id, 'episodes', 'query'], params=params)
+            for episode in resp['data']:
+                yield episode
+            next_page = (resp.get('links') or {}).get('next')
+            if not next_page:
+                return
+            params['page'] = next_page
+
+    @requires_auth
+    async def get_episodes_summary(self, series_id):
+        """Return a summary of the episodes and seasons for the series.
+
+        .. warning::
+
+            authorization token required
+
+        .. note::
+
+            Season "0" is for all episodes that are considered to be specials.
+
+        :param str series_id: id of series as found on thetvdb
+        :returns: summary of the episodes and seasons for the series
+        :rtype: dict
+        """
+        resp = await self._exec_request(
+            'series', path_args=[series_id, 'episodes', 'summary'])
+        return resp['data']
+
+    @requires_auth
+    async def get_series_image_info(self, series_id):
+        """Return a summary of the images for a particular series.
+
+        .. warning::
+
+            authorization token required
+
+        :param str series_id: id of series as found on thetvdb
+        :returns: summary of the images for the series
+        :rtype: dict
+        """
+        resp = await self._exec_request(
+            'series', path_args=[series_id, 'images'])
+        return resp['data']
+
+    @requires_auth
+    async def get_episode(self, episode_id):
+        """Return the full information for a given episode id.
+
+        .. warning::
+
+            authorization token required
+
+        :param str episode_id: id of episode as found on thetvdb
+        :returns: episode record
+        :rtype: dict
+        """
+        resp = await self._exec_request('episodes', path_args=[episode_id])
+        return resp['data']
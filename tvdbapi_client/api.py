@@ -1,16 +1,31 @@
 """Provide API client for TVDB API v2.0 services."""
+from concurrent import futures
+import copy
+import functools
 import json
 import logging
+import ssl
+import threading
+import time
 
 import cachecontrol
-from cachecontrol import caches
+from cachecontrol import cache as http_cache
 from oslo_config import cfg
 import requests
-import six
 
 from tvdbapi_client import exceptions
 from tvdbapi_client import timeutil
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
 LOG = logging.getLogger(__name__)
 
 cfg.CONF.import_group('tvdb', 'tvdbapi_client.options')
@@ -20,6 +35,19 @@ DEFAULT_HEADERS = {
     'Content-Type': 'application/json',
 }
 
+# sizing for the keep-alive connection pool shared by all api calls
+POOL_MAXSIZE = 10
+
+# sizing for the in-memory cache of parsed GET lookups
+MEM_CACHE_SIZE = 1024
+
+# number of concurrent requests for bulk fetches
+DEFAULT_WORKERS = 8
+
+# token lifetime in seconds; ONE_HOUR is deliberately short of a full
+# hour so the token can be refreshed before the service expires it
+TOKEN_TTL = timeutil.ONE_HOUR.total_seconds()
+
 SERIES_BY = [
     'name',
     'imdbId',
@@ -37,6 +65,69 @@ EPISODES_BY = [
 ]
 
 
+def _dumps(data):
+    """Serialize a request payload to a JSON body.
+
+    :param dict data: request payload
+    :returns: encoded request body
+    :rtype: bytes or str
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data)
+
+
+def _loads(content):
+    """Deserialize a JSON response body.
+
+    :param bytes content: raw response body
+    :returns: decoded response body
+    :rtype: dict
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    # json.loads accepts bytes directly; decoding here would copy the
+    # whole body (100+ KB for episode queries) just to throw it away.
+    return json.loads(content)
+
+
+def _make_ssl_context():
+    """Build the SSLContext shared by all pooled connections.
+
+    TLS compression is disabled explicitly (CRIME mitigation) and the
+    minimum version pinned to TLS 1.2 so every connection negotiates a
+    modern handshake; TLS 1.3 is preferred automatically when the
+    service offers it.
+
+    :returns: configured ssl context
+    :rtype: :py:obj:`ssl.SSLContext`
+    """
+    ctx = ssl.create_default_context()
+    ctx.minimum_version = ssl.TLSVersion.TLSv1_2
+    ctx.options |= ssl.OP_NO_COMPRESSION
+    return ctx
+
+
+class _TVDBAdapter(cachecontrol.CacheControlAdapter):
+
+    """Cache adapter pinning one SSLContext for all pooled connections.
+
+    Sharing the context lets TLS session tickets cached inside it be
+    reused on reconnect, cutting the handshake to a single round trip
+    (or zero with TLS 1.3 resumption).
+    """
+
+    def __init__(self, ssl_context=None, **kwargs):
+        self._ssl_context = ssl_context
+        super(_TVDBAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kw):
+        if self._ssl_context is not None:
+            pool_kw['ssl_context'] = self._ssl_context
+        super(_TVDBAdapter, self).init_poolmanager(
+            connections, maxsize, block, **pool_kw)
+
+
 def requires_auth(func):
     """Handle authentication checks.
 
@@ -44,10 +135,14 @@ def requires_auth(func):
 
         Checks if the token has expired and performs authentication if needed.
     """
-    @six.wraps(func)
+    @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         if self.token_expired:
-            self.authenticate()
+            # double-checked so concurrent callers refresh the
+            # token once instead of racing authenticate
+            with self._auth_lock:
+                if self.token_expired:
+                    self.authenticate()
         return func(self, *args, **kwargs)
     return wrapper
 
@@ -56,6 +151,27 @@ class TVDBClient(object):
 
     """TVDB Api client."""
 
+    __slots__ = (
+        '__apikey',
+        '__username',
+        '__userpass',
+        '__token',
+        '__login_body',
+        '_token_timer',
+        '_token_deadline',
+        '_session',
+        '_auth_lock',
+        '_auth_header',
+        '_headers_cache',
+        '_language',
+        '_parser',
+        '_url_cache',
+        '_mem_get',
+        '_base_url',
+        '_verify',
+        '_select_first',
+    )
+
     def __init__(self, apikey=None, username=None, userpass=None):
         """Create new instance of API client.
 
@@ -67,20 +183,55 @@ class TVDBClient(object):
         self.__username = username or cfg.CONF.tvdb.username
         self.__userpass = userpass or cfg.CONF.tvdb.userpass
         self.__token = None
+        # the login body only depends on the credentials, so it is
+        # encoded once here instead of per authentication
+        self.__login_body = _dumps({'apikey': self.__apikey,
+                                    'username': self.__username,
+                                    'userpass': self.__userpass,
+                                    })
 
         self._token_timer = None
+        self._token_deadline = 0.0
         self._session = None
-        self._headers = DEFAULT_HEADERS
+        self._auth_lock = threading.Lock()
+        self._auth_header = None
+        self._headers_cache = None
         self._language = 'en'
+        self._parser = threading.local() if simdjson is not None else None
+        self._url_cache = {}
+        self._mem_get = functools.lru_cache(
+            maxsize=MEM_CACHE_SIZE)(self._cached_get)
+        self.reload_config()
+
+    def reload_config(self):
+        """Re-read service configuration into the client.
+
+        Configuration is snapshotted into plain instance attributes so
+        the request hot path does not pay oslo.config attribute lookups
+        per call; call this after changing any tvdb option at runtime.
+        """
+        self._base_url = cfg.CONF.tvdb.service_url.rstrip('/')
+        self._verify = cfg.CONF.tvdb.verify_ssl_certs
+        self._select_first = cfg.CONF.tvdb.select_first
+        self._url_cache.clear()
+        # records memoized from the previous service url must not
+        # outlive the reconfiguration
+        self._mem_get.cache_clear()
 
     @property
     def headers(self):
-        """Provide access to updated headers."""
-        self._headers.update(**{'Accept-Language': self.language})
-        if self.__token:
-            self._headers.update(
-                **{'Authorization': 'Bearer %s' % self.__token})
-        return self._headers
+        """Provide access to updated headers.
+
+        The headers are rebuilt only after the token or language
+        changes; back-to-back calls reuse the cached dict.
+        """
+        if self._headers_cache is None:
+            headers = dict(DEFAULT_HEADERS)
+            headers['Accept-Language'] = self._language
+            if self._auth_header:
+                headers['Authorization'] = self._auth_header
+            self._headers_cache = headers
+        return self._headers_cache
 
     @property
     def language(self):
@@ -91,52 +242,127 @@ class TVDBClient(object):
     def language(self, abbr):
         """Provide access to update language."""
         self._language = abbr
+        self._headers_cache = None
+        self._mem_get.cache_clear()
 
     @property
     def token_expired(self):
-        """Provide access to flag indicating if token has expired."""
-        if self._token_timer is None:
-            return True
-        return timeutil.is_newer_than(self._token_timer, timeutil.ONE_HOUR)
+        """Provide access to flag indicating if token has expired.
+
+        The deadline is precomputed against the monotonic clock at
+        authentication time, so the per-request check is a single
+        float compare.
+        """
+        return time.monotonic() >= self._token_deadline
 
     @property
     def session(self):
-        """Provide access to request session with local cache enabled."""
+        """Provide access to request session with local cache enabled.
+
+        A single session is kept for the life of the client so warm
+        calls reuse the pooled TCP/TLS connections instead of paying
+        connection setup per request.
+        """
         if self._session is None:
-            self._session = cachecontrol.CacheControl(
-                requests.Session(),
-                cache=caches.FileCache('.tvdb_cache'))
+            session = requests.Session()
+            adapter = _TVDBAdapter(
+                ssl_context=_make_ssl_context() if self._verify else None,
+                cache=http_cache.DictCache(),
+                pool_connections=POOL_MAXSIZE,
+                pool_maxsize=POOL_MAXSIZE)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._session = session
         return self._session
 
+    def _cached_get(self, service, path_args, language):
+        """Issue a GET and return the parsed data payload.
+
+        Wrapped by an LRU cache at init so repeat lookups for the same
+        record bypass HTTP entirely; the key includes the language so a
+        language switch cannot serve stale records.
+
+        :param str service: name of service endpoint
+        :param tuple path_args: path arguments for the request
+        :param str language: language the request is issued for
+        :returns: data payload of the response
+        :rtype: dict
+        """
+        return self._exec_request(service, path_args=path_args)['data']
+
+    def _mem_lookup(self, service, path_args):
+        """Return a memoized GET lookup as a fresh copy.
+
+        Copying on the way out keeps caller-side mutation of a
+        returned record from poisoning the cached entry served to
+        subsequent lookups.
+
+        :param str service: name of service endpoint
+        :param tuple path_args: path arguments for the request
+        :returns: data payload of the response
+        :rtype: dict
+        """
+        return copy.deepcopy(
+            self._mem_get(service, path_args, self._language))
+
+    def _parse_response(self, content):
+        """Parse a JSON response body.
+
+        A simdjson parser is reused across calls when available; the
+        parser grows its internal buffer once and reuses it, so no
+        per-response scratch allocation is made on this path. The
+        parsed document is materialized before returning since the
+        parser buffer is invalidated by the next parse. A simdjson
+        parser supports only one live document and is not thread-safe,
+        so each thread (get_many_series fans out over a pool) gets its
+        own parser via a thread local.
+
+        :param bytes content: raw response body
+        :returns: decoded response body
+        :rtype: dict
+        """
+        if self._parser is not None:
+            try:
+                parser = self._parser.parser
+            except AttributeError:
+                parser = self._parser.parser = simdjson.Parser()
+            return parser.parse(content).as_dict()
+        return _loads(content)
+
     @exceptions.error_map
     def _exec_request(self, service, method=None, path_args=None, data=None,
                       params=None):
         """Execute request."""
-        if path_args is None:
-            path_args = []
-
-        req = {
-            'method': method or 'get',
-            'url': '/'.join(str(a).strip('/') for a in [
-                cfg.CONF.tvdb.service_url, service] + path_args),
-            'data': json.dumps(data) if data else None,
-            'headers': self.headers,
-            'params': params,
-            'verify': cfg.CONF.tvdb.verify_ssl_certs,
-        }
-
-        LOG.debug('executing request (%s %s)', req['method'], req['url'])
-        resp = self.session.request(**req)
+        try:
+            url = self._url_cache[service]
+        except KeyError:
+            url = self._url_cache[service] = '%s/%s' % (
+                self._base_url, service.strip('/'))
+        if path_args:
+            url = '%s/%s' % (
+                url, '/'.join(str(a).strip('/') for a in path_args))
+
+        method = method or 'get'
+        LOG.debug('executing request (%s %s)', method, url)
+        if data is not None and not isinstance(
+                data, (bytes, bytearray, memoryview, str)):
+            data = _dumps(data)
+        resp = self.session.request(
+            method, url,
+            data=data,
+            headers=self.headers,
+            params=params,
+            verify=self._verify)
 
         resp.raise_for_status()
-        return resp.json() if resp.text else resp.text
+        # checking content instead of text avoids decoding the whole
+        # body just to test for an empty response
+        content = resp.content
+        return self._parse_response(content) if content else ''
 
     def _login(self):
-        data = {'apikey': self.__apikey,
-                'username': self.__username,
-                'userpass': self.__userpass,
-                }
-        return self._exec_request('login', method='post', data=data)
+        return self._exec_request(
+            'login', method='post', data=self.__login_body)
 
     def _refresh_token(self):
         return self._exec_request('refresh_token')
@@ -156,7 +382,11 @@ class TVDBClient(object):
             resp = self._login()
 
         self.__token = resp.get('token')
+        self._auth_header = (
+            'Bearer %s' % self.__token if self.__token else None)
+        self._headers_cache = None
         self._token_timer = timeutil.utcnow()
+        self._token_deadline = time.monotonic() + TOKEN_TTL
 
     @requires_auth
     def search_series(self, **kwargs):
@@ -176,13 +406,11 @@ class TVDBClient(object):
         :returns: series record or series records
         :rtype: dict
         """
-        params = {}
-        for arg, val in six.iteritems(kwargs):
-            if arg in SERIES_BY:
-                params[arg] = val
+        params = {arg: val for arg, val in kwargs.items()
+                  if arg in SERIES_BY}
         resp = self._exec_request(
             'search', path_args=['series'], params=params)
-        if cfg.CONF.tvdb.select_first:
+        if self._select_first:
             return resp['data'][0]
         return resp['data']
 
@@ -194,11 +422,38 @@ class TVDBClient(object):
 
             authorization token required
 
+        .. note::
+
+            Results are memoized in memory until the language changes;
+            repeat lookups are served from the cache without hitting
+            the API, and each call returns a fresh copy.
+
         :param str series_id: id of series as found on thetvdb
         :returns: series record
         :rtype: dict
         """
-        return self._exec_request('series', path_args=[series_id])['data']
+        return self._mem_lookup('series', (series_id,))
+
+    @requires_auth
+    def get_many_series(self, series_ids, workers=DEFAULT_WORKERS):
+        """Retrieve series records for multiple series concurrently.
+
+        Requests are issued from a thread pool over the shared
+        connection pool so the socket reads overlap, hiding latency
+        when fanning out over many series.
+
+        .. warning::
+
+            authorization token required
+
+        :param series_ids: ids of series as found on thetvdb
+        :type series_ids: list
+        :param int workers: maximum number of concurrent requests
+        :returns: series records in the order requested
+        :rtype: list
+        """
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.get_series, series_ids))
 
     @requires_auth
     def get_episodes(self, series_id, **kwargs):
@@ -226,13 +481,56 @@ class TVDBClient(object):
         :rtype: list
         """
         params = {'page': 1}
-        for arg, val in six.iteritems(kwargs):
+        for arg, val in kwargs.items():
             if arg in EPISODES_BY:
                 params[arg] = val
         return self._exec_request(
             'series',
             path_args=[series_id, 'episodes', 'query'], params=params)['data']
 
+    @requires_auth
+    def iter_episodes(self, series_id, **kwargs):
+        """Iterate over all episodes for a given series.
+
+        Pages are fetched lazily (100 results per page) by following
+        the pagination links, and each page is released before the next
+        one is requested, keeping peak memory flat even for series with
+        thousands of episodes.
+
+        .. warning::
+
+            authorization token required
+
+        The following search arguments currently supported:
+
+            * airedSeason
+            * airedEpisode
+            * imdbId
+            * dvdSeason
+            * dvdEpisode
+            * absoluteNumber
+            * page
+
+        :param str series_id: id of series as found on thetvdb
+        :parm kwargs: keyword args to search/filter episodes by (optional)
+        :returns: generator of series episode records
+        :rtype: generator
+        """
+        params = {'page': 1}
+        for arg, val in kwargs.items():
+            if arg in EPISODES_BY:
+                params[arg] = val
+        while True:
+            resp = self._exec_request(
+                'series',
+                path_args=[series_id, 'episodes', 'query'], params=params)
+            for episode in resp['data']:
+                yield episode
+            next_page = (resp.get('links') or {}).get('next')
+            if not next_page:
+                return
+            params['page'] = next_page
+
     @requires_auth
     def get_episodes_summary(self, series_id):
         """Return a summary of the episodes and seasons for the series.
@@ -260,12 +558,17 @@ class TVDBClient(object):
 
             authorization token required
 
+        .. note::
+
+            Results are memoized in memory until the language changes;
+            repeat lookups are served from the cache without hitting
+            the API, and each call returns a fresh copy.
+
         :param str series_id: id of series as found on thetvdb
         :returns: summary of the images for the series
         :rtype: dict
         """
-        return self._exec_request(
-            'series', path_args=[series_id, 'images'])['data']
+        return self._mem_lookup('series', (series_id, 'images'))
 
     @requires_auth
     def get_episode(self, episode_id):
@@ -275,8 +578,14 @@ class TVDBClient(object):
 
             authorization token required
 
+        .. note::
+
+            Results are memoized in memory until the language changes;
+            repeat lookups are served from the cache without hitting
+            the API, and each call returns a fresh copy.
+
         :param str episode_id: id of episode as found on thetvdb
         :returns: episode record
         :rtype: dict
         """
-        return self._exec_request('episodes', path_args=[episode_id])['data']
+        return self._mem_lookup('episodes', (episode_id,))
@@ -1,6 +1,7 @@
 """Exceptions for API and decorator to wrap request exceptions."""
+import functools
+
 from requests import exceptions
-import six
 
 
 def error_map(func):
@@ -8,7 +9,7 @@ def error_map(func):
 
     .. py:decorator:: error_map
     """
-    @six.wraps(func)
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
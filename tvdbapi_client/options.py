@@ -32,6 +32,9 @@ cfg.CONF.register_opts(OPTS, 'tvdb')
 def _make_opt_list(opts, group):
     """Generate a list of tuple containing group, options
 
+    The option objects are shared references; the sample config
+    generator only reads them, so no copies are made.
+
     :param opts: option lists associated with a group
     :type opts: list
     :param group: name of an option group
@@ -39,11 +42,7 @@ def _make_opt_list(opts, group):
     :return: a list of (group_name, opts) tuples
     :rtype: list
     """
-    import copy
-    import itertools
-
-    _opts = [(group, list(itertools.chain(*opts)))]
-    return [(g, copy.deepcopy(o)) for g, o in _opts]
+    return [(group, [opt for opt_list in opts for opt in opt_list])]
 
 
 def list_opts():
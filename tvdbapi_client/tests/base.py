@@ -4,7 +4,7 @@ import logging
 from oslo_config import fixture as fixture_config
 from oslotest import base as test_base
 from requests_mock.contrib import fixture as requests_mock_fixture
-from six.moves.urllib import parse
+from urllib import parse
 
 # see urllib3 regarding InsecureRequestWarning and InsecurePlatformWarning
 logging.captureWarnings(True)
@@ -0,0 +1,200 @@
+import asyncio
+import re
+import time
+
+import testtools
+
+from tvdbapi_client import api
+from tvdbapi_client import exceptions
+from tvdbapi_client.tests import base
+from tvdbapi_client.tests import schema_helper
+
+try:
+    from aioresponses import aioresponses
+    from tvdbapi_client import aio
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+
+@testtools.skipUnless(HAS_AIOHTTP, 'aiohttp/aioresponses not installed')
+class AsyncApiTest(base.BaseTest):
+
+    def setUp(self):
+        super(AsyncApiTest, self).setUp()
+        self.client = aio.AsyncTVDBClient(apikey='abc123xyz456',
+                                          username='test_user',
+                                          userpass='sample')
+
+    def test_set_language(self):
+        self.assertEqual(self.client.language, 'en')
+        self.client.language = 'es'
+        self.assertEqual(self.client.language, 'es')
+
+    def test_token_expired(self):
+        # never authenticated
+        self.assertTrue(self.client.token_expired)
+
+        # deadline still ahead
+        self.client._token_deadline = time.monotonic() + api.TOKEN_TTL
+        self.assertFalse(self.client.token_expired)
+
+        # deadline passed
+        self.client._token_deadline = time.monotonic() - 1
+        self.assertTrue(self.client.token_expired)
+
+    def test_headers_cached(self):
+        headers = self.client.headers
+        self.assertEqual(headers['Accept-Language'], 'en')
+        self.assertNotIn('Authorization', headers)
+
+        # back-to-back access reuses the cached dict
+        self.assertIs(self.client.headers, headers)
+
+        # a language switch invalidates the cache
+        self.client.language = 'es'
+        self.assertIsNot(self.client.headers, headers)
+        self.assertEqual(self.client.headers['Accept-Language'], 'es')
+
+
+@testtools.skipUnless(HAS_AIOHTTP, 'aiohttp/aioresponses not installed')
+class MockedAsyncApiTest(base.BaseTest):
+
+    def setUp(self):
+        super(MockedAsyncApiTest, self).setUp()
+        self.base_url = self.CONF.tvdb.service_url
+
+    def run_async(self, coro_func):
+        """Run a client coroutine to completion on a fresh loop.
+
+        The client is created and closed inside the loop so the
+        aiohttp session is bound to it.
+        """
+        async def runner():
+            async with aio.AsyncTVDBClient(apikey='abc123xyz456',
+                                           username='test_user',
+                                           userpass='sample') as client:
+                return await coro_func(client)
+        return asyncio.run(runner())
+
+    def url(self, *parts):
+        return '/'.join([self.base_url] + [str(p) for p in parts])
+
+    def test_authenticate_login(self):
+        async def scenario(client):
+            with aioresponses() as mocked:
+                mocked.post(self.url('login'), payload={'token': 'abc123'})
+                await client.authenticate()
+            return client._token_timer
+
+        self.assertIsNotNone(self.run_async(scenario))
+
+    def test_authenticate_refresh(self):
+        async def scenario(client):
+            with aioresponses() as mocked:
+                mocked.post(self.url('login'), payload={'token': 'abc123'})
+                await client.authenticate()
+                first_ts = client._token_timer
+
+                mocked.get(self.url('refresh_token'),
+                           payload={'token': 'abc456'})
+                await client.authenticate()
+                self.assertGreater(client._token_timer, first_ts)
+
+                # a 401 on refresh falls back to login
+                mocked.get(self.url('refresh_token'), status=401)
+                mocked.post(self.url('login'), payload={'token': 'abc789'})
+                await client.authenticate()
+
+                # any other error propagates
+                mocked.get(self.url('refresh_token'), status=400)
+                with testtools.ExpectedException(
+                        exceptions.TVDBRequestException):
+                    await client.authenticate()
+
+        self.run_async(scenario)
+
+    def test_get_series(self):
+        resp_data = schema_helper.make_response(
+            schema_helper.SERIES,
+            {'id': 80379,
+             'seriesName': 'The Big Bang Theory'})
+
+        async def scenario(client):
+            with aioresponses() as mocked:
+                mocked.post(self.url('login'), payload={'token': 'abc123'})
+                mocked.get(self.url('series', 80379), payload=resp_data)
+                return await client.get_series(80379)
+
+        series = self.run_async(scenario)
+        self.assertEqual(series['seriesName'], 'The Big Bang Theory')
+
+    def test_search_series(self):
+        resp_data = schema_helper.make_response(
+            schema_helper.SEARCH_SERIES,
+            {'id': 80379,
+             'name': 'The Big Bang Theory'},
+            as_list=True)
+        pattern = re.compile(r'.*/search/series\?.*')
+
+        async def scenario(client):
+            with aioresponses() as mocked:
+                mocked.post(self.url('login'), payload={'token': 'abc123'})
+                mocked.get(pattern, payload=resp_data)
+                return await client.search_series(name='The Big Bang Theory')
+
+        series = self.run_async(scenario)
+        self.assertEqual(len(series), 1)
+        self.assertEqual(series[0]['id'], 80379)
+
+    def test_gather_single_login(self):
+        responses = {}
+        for series_id, name in [(80379, 'The Big Bang Theory'),
+                                (94981, 'Covert Affairs')]:
+            responses[series_id] = schema_helper.make_response(
+                schema_helper.SERIES,
+                {'id': series_id,
+                 'seriesName': name})
+
+        async def scenario(client):
+            with aioresponses() as mocked:
+                # only one login is registered; a second concurrent
+                # authentication attempt would find no matching mock
+                mocked.post(self.url('login'), payload={'token': 'abc123'})
+                for series_id, resp_data in responses.items():
+                    mocked.get(self.url('series', series_id),
+                               payload=resp_data)
+                return await asyncio.gather(
+                    client.get_series(80379),
+                    client.get_series(94981))
+
+        series = self.run_async(scenario)
+        self.assertEqual(sorted(s['id'] for s in series), [80379, 94981])
+
+    def test_iter_episodes(self):
+        first_page = schema_helper.make_response(
+            schema_helper.EPISODES,
+            {'id': 1},
+            as_list=True,
+            total=100)
+        first_page['links'] = {'next': 2}
+
+        last_page = schema_helper.make_response(
+            schema_helper.EPISODES,
+            {'id': 2},
+            as_list=True,
+            total=17)
+
+        pattern = re.compile(r'.*/series/94981/episodes/query\?.*')
+
+        async def scenario(client):
+            with aioresponses() as mocked:
+                mocked.post(self.url('login'), payload={'token': 'abc123'})
+                mocked.get(pattern, payload=first_page)
+                mocked.get(pattern, payload=last_page)
+                return [ep async for ep in client.iter_episodes(94981)]
+
+        episodes = self.run_async(scenario)
+        self.assertEqual(len(episodes), 117)
+        self.assertEqual(episodes[0]['id'], 1)
+        self.assertEqual(episodes[-1]['id'], 2)
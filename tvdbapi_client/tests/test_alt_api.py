@@ -117,6 +117,7 @@ class MockedApiTest(base.BaseHTTPTest):
                       params={'name': 'The Big Bang Theory'},
                       data=resp_data)
         self.CONF.set_override('select_first', True, 'tvdb')
+        self.client.reload_config()
         series = self.client.search_series(name='The Big Bang Theory')
         self.assertEqual(series['id'], 80379)
 
@@ -133,6 +134,11 @@ class MockedApiTest(base.BaseHTTPTest):
         series = self.client.get_series(80379)
         self.assertEqual(series['seriesName'], 'The Big Bang Theory')
 
+        # mutating a returned record must not poison the cached copy
+        series['seriesName'] = 'mutated'
+        series = self.client.get_series(80379)
+        self.assertEqual(series['seriesName'], 'The Big Bang Theory')
+
         self.stub_url(parts=['series', 0],
                       status_code=404)
         self.assertRaises(exceptions.TVDBRequestException,
@@ -145,6 +151,19 @@ class MockedApiTest(base.BaseHTTPTest):
                           self.client.get_series,
                           0)
 
+    def test_get_many_series(self):
+        for series_id, name in [(80379, 'The Big Bang Theory'),
+                                (94981, 'Covert Affairs')]:
+            resp_data = schema_helper.make_response(
+                schema_helper.SERIES,
+                {'id': series_id,
+                 'seriesName': name})
+            self.stub_url(parts=['series', series_id],
+                          data=resp_data)
+
+        series = self.client.get_many_series([80379, 94981])
+        self.assertEqual([s['id'] for s in series], [80379, 94981])
+
     def test_get_episodes(self):
         resp_data = schema_helper.make_response(
             schema_helper.EPISODES,
@@ -175,6 +194,31 @@ class MockedApiTest(base.BaseHTTPTest):
                           self.client.get_episodes,
                           0, other='abc')
 
+    def test_iter_episodes(self):
+        first_page = schema_helper.make_response(
+            schema_helper.EPISODES,
+            {'id': 1},
+            as_list=True,
+            total=100)
+        first_page['links'] = {'next': 2}
+
+        last_page = schema_helper.make_response(
+            schema_helper.EPISODES,
+            {'id': 2},
+            as_list=True,
+            total=17)
+
+        self.stub_url(parts=['series', 94981, 'episodes', 'query'],
+                      params={'page': 1},
+                      data=first_page)
+        self.stub_url(parts=['series', 94981, 'episodes', 'query'],
+                      params={'page': 2},
+                      data=last_page)
+        episodes = list(self.client.iter_episodes(94981))
+        self.assertEqual(len(episodes), 117)
+        self.assertEqual(episodes[0]['id'], 1)
+        self.assertEqual(episodes[-1]['id'], 2)
+
     def test_get_episodes_summary(self):
         resp_data = schema_helper.make_response(
             schema_helper.EPISODES_SUMMARY,
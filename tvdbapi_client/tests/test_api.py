@@ -1,5 +1,5 @@
-import datetime
 import os
+import time
 
 import testtools
 from testtools import matchers
@@ -8,9 +8,6 @@ import tvdbapi_client
 from tvdbapi_client import api
 from tvdbapi_client import exceptions
 from tvdbapi_client.tests import base
-from tvdbapi_client import timeutil
-
-MINS_15 = datetime.timedelta(minutes=15)
 
 
 def disabled():
@@ -33,26 +30,15 @@ class ApiTest(base.BaseTest):
         self.assertEqual(self.client.language, 'es')
 
     def test_token_expired(self):
+        # never authenticated
         self.assertTrue(self.client.token_expired)
 
-        # current time
-        self.client._token_timer = timeutil.utcnow()
-        self.assertFalse(self.client.token_expired)
-
-        # 15 minutes after current
-        self.client._token_timer += MINS_15
-        self.assertFalse(self.client.token_expired)
-
-        # 30 minutes after current
-        self.client._token_timer += MINS_15
-        self.assertFalse(self.client.token_expired)
-
-        # 45 minutes after current
-        self.client._token_timer += MINS_15
+        # deadline still ahead
+        self.client._token_deadline = time.monotonic() + api.TOKEN_TTL
         self.assertFalse(self.client.token_expired)
 
-        # 60 minutes after current
-        self.client._token_timer += MINS_15
+        # deadline passed
+        self.client._token_deadline = time.monotonic() - 1
         self.assertTrue(self.client.token_expired)
 
     @testtools.skipIf(disabled(), 'live api testing disabled')
@@ -88,6 +74,7 @@ class ApiTest(base.BaseTest):
                           name='Fake Unknown Test')
 
         self.CONF.set_override('select_first', True, 'tvdb')
+        self.client.reload_config()
         series = self.client.search_series(name='The Big Bang Theory')
         self.assertEqual(series['id'], 80379)
 